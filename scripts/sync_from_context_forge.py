@@ -11,7 +11,7 @@ Two upstream artefacts are read:
 
 For every upstream entry we generate a per-server manifest at
 `servers/ibm-context-forge/<synthesised-id>/manifest.json` and merge it into
-the top-level `index.json`.
+the top-level `index.json` (mirrored one path per line in `manifests.ndjson`).
 
 Production-safety invariants enforced here:
 
@@ -38,30 +38,43 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import codecs
 import datetime
 import hashlib
+import itertools
 import json
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-import httpx
-import yaml
+# httpx and yaml are imported where they are used: together they are most of
+# the script's import time, and neither is needed for --help or for callers
+# that only merge already-parsed entries.
+
+try:  # optional accelerator; results always match the stdlib json module.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 OUR_SOURCE = "mcp-context-forge"
 PROVIDER_DIR = "ibm-context-forge"   # all manifests written by us live here
+OUR_PREFIX = f"servers/{PROVIDER_DIR}/"
 DEFAULT_TIMEOUT = 30.0
 
 
 # --------------------------- helpers ---------------------------
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slug(s: str) -> str:
     """Lowercase + ASCII-safe + hyphenated; strip leading/trailing dashes."""
-    s = (s or "").lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
+    s = _SLUG_RE.sub("-", (s or "").lower())
     return s.strip("-") or "x"
 
 
@@ -69,7 +82,127 @@ def _hash10(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()[:10]
 
 
+def _now_iso() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+# json.dumps(ensure_ascii=True) escapes everything outside printable ASCII
+# (including DEL); orjson emits raw UTF-8. We re-escape orjson output so the
+# bytes on disk are identical whichever backend wrote them. The escaping runs
+# as a codec error handler: the ASCII encoder scans in C and only calls back
+# for the (rare) non-ASCII runs, ~4x faster than a regex pass over index.json.
+def _json_ascii_escape(err: UnicodeError) -> Tuple[str, int]:
+    if not isinstance(err, UnicodeEncodeError):
+        raise err
+    out = []
+    for ch in err.object[err.start:err.end]:
+        c = ord(ch)
+        if c < 0x10000:
+            out.append(f"\\u{c:04x}")
+        else:
+            c -= 0x10000
+            out.append(f"\\u{0xD800 | (c >> 10):04x}\\u{0xDC00 | (c & 0x3FF):04x}")
+    return "".join(out), err.end
+
+
+codecs.register_error("catalog-json-ascii", _json_ascii_escape)
+
+
+_JSON_SCALARS = (str, int, bool, type(None))
+
+
+def _orjson_lossy(obj: Any) -> bool:
+    """True iff `obj` may differ from what `json.loads` returns. orjson turns
+    integers outside the 64-bit range into floats; any integral float that
+    large is treated as suspect and the input re-parsed."""
+    if type(obj) is not dict and type(obj) is not list:
+        return type(obj) is float and obj.is_integer() and abs(obj) >= 2.0 ** 63
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        for v in (o.values() if type(o) is dict else o):
+            if type(v) in _JSON_SCALARS:
+                continue
+            if type(v) is dict or type(v) is list:
+                stack.append(v)
+            elif type(v) is float and v.is_integer() and abs(v) >= 2.0 ** 63:
+                return True
+    return False
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse `data` (bytes or a buffer) exactly as `json.loads` would.
+
+    orjson is tried first. Input it rejects but the stdlib accepts (NaN,
+    Infinity, lone surrogate escapes) or parses lossily falls back to
+    `json.loads`, so a readable file never looks unreadable.
+    """
+    if orjson is not None:
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if not _orjson_lossy(obj):
+                return obj
+    return json.loads(data if isinstance(data, (bytes, str)) else bytes(data))
+
+
+_MMAP_MIN_BYTES = 1 << 20   # below this a plain read is as cheap as a mapping
+
+
+def _json_load_file(p: Path) -> Any:
+    """Parse a JSON file. Large files (index.json is tens of MB) are mapped and
+    handed to orjson directly, skipping an intermediate bytes copy."""
+    with p.open("rb") as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as mv:
+            return _json_loads(mv)
+
+
+def _orjson_exact(obj: Any) -> bool:
+    """True iff orjson renders `obj` exactly as the stdlib would: only dicts,
+    lists, strings, ints, bools and None. Floats are excluded (orjson spells
+    exponents differently and turns NaN/Infinity into null), as is anything
+    the stdlib would reject, such as YAML datetimes."""
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        for v in (o.values() if type(o) is dict else o):
+            if type(v) in _JSON_SCALARS:
+                continue
+            if type(v) is dict or type(v) is list:
+                stack.append(v)
+            else:
+                return False
+    return True
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialise as `json.dumps(obj, indent=2, sort_keys=True) + "\\n"`."""
+    if orjson is not None and type(obj) in (dict, list) and _orjson_exact(obj):
+        try:
+            out = orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            # e.g. ints wider than 64 bits; let the stdlib handle the odd case.
+            pass
+        else:
+            if out.isascii() and b"\x7f" not in out:
+                return out
+            return (
+                out.decode("utf-8")
+                .encode("ascii", errors="catalog-json-ascii")
+                .replace(b"\x7f", b"\\u007f")
+            )
+    return (json.dumps(obj, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
 def _http_get_text(url: str, *, token: Optional[str] = None) -> str:
+    import httpx
+
     headers = {"User-Agent": "agent-matrix-catalog/sync-context-forge"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
@@ -80,6 +213,8 @@ def _http_get_text(url: str, *, token: Optional[str] = None) -> str:
 
 
 def _http_get_json(url: str, *, token: Optional[str] = None) -> Any:
+    import httpx
+
     headers = {
         "User-Agent": "agent-matrix-catalog/sync-context-forge",
         "Accept": "application/vnd.github+json",
@@ -111,6 +246,7 @@ class SyncReport:
     updated: List[str] = field(default_factory=list)
     removed: List[str] = field(default_factory=list)
     skipped_collisions: List[str] = field(default_factory=list)
+    unchanged: int = 0
     fetched_catalog: int = 0
     fetched_repo_servers: int = 0
 
@@ -122,13 +258,21 @@ class SyncReport:
             "updated":                 len(self.updated),
             "removed":                 len(self.removed),
             "skipped_collisions":      len(self.skipped_collisions),
+            "unchanged":               self.unchanged,
         }
 
 
 # --------------------------- parser A: mcp-catalog.yml ---------------------------
 
-def parse_catalog_yml(text: str, *, source_url: str) -> List[ContextForgeEntry]:
+CATALOG_TRANSPORTS = frozenset({"SSE", "STREAMABLEHTTP", "STDIO", "WEBSOCKET", "HTTP"})
+
+
+def parse_catalog_yml(
+    text: str, *, source_url: str, synced_at: Optional[str] = None,
+) -> List[ContextForgeEntry]:
     """Parse IBM's mcp-catalog.yml top-level list of remote MCP endpoints."""
+    import yaml
+
     data = yaml.safe_load(text)
     if isinstance(data, dict):
         # IBM's mcp-catalog.yml uses `catalog_servers`. Older / forked
@@ -141,7 +285,7 @@ def parse_catalog_yml(text: str, *, source_url: str) -> List[ContextForgeEntry]:
         raise ValueError("mcp-catalog.yml: expected a top-level list of entries")
 
     out: List[ContextForgeEntry] = []
-    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    now_iso = synced_at or _now_iso()
     for raw in data:
         if not isinstance(raw, dict):
             continue
@@ -151,10 +295,13 @@ def parse_catalog_yml(text: str, *, source_url: str) -> List[ContextForgeEntry]:
         if not ibm_id or not name or not url:
             continue
         transport = (raw.get("transport") or "SSE").upper()
-        if transport not in {"SSE", "STREAMABLEHTTP", "STDIO", "WEBSOCKET", "HTTP"}:
+        if transport not in CATALOG_TRANSPORTS:
             transport = "SSE"
         cat_id = f"mcp.ibm-cf.{_slug(ibm_id)}.{transport.lower()}.{_hash10(url)}"
-        manifest_path = f"servers/{PROVIDER_DIR}/{cat_id}/manifest.json"
+        manifest_path = f"{OUR_PREFIX}{cat_id}/manifest.json"
+        description = str(raw.get("description") or name)
+        provider    = raw.get("provider")
+        category    = raw.get("category")
 
         manifest = {
             "id":          cat_id,
@@ -163,12 +310,12 @@ def parse_catalog_yml(text: str, *, source_url: str) -> List[ContextForgeEntry]:
             "version":     "1.0.0",
             "status":      "active",
             "transport":   transport,
-            "summary":     str(raw.get("description") or name),
-            "description": str(raw.get("description") or name),
+            "summary":     description,
+            "description": description,
             "homepage":    raw.get("repo") or None,
             "source_url":  url,
-            "providers":   [str(raw.get("provider") or "")] if raw.get("provider") else [],
-            "categories":  [str(raw.get("category") or "")] if raw.get("category") else [],
+            "providers":   [str(provider)] if provider else [],
+            "categories":  [str(category)] if category else [],
             "auth": {
                 "type":             raw.get("auth_type"),
                 "requires_api_key": bool(raw.get("requires_api_key", False)),
@@ -197,10 +344,13 @@ LANG_INSTALL_HINTS = {
     "go":     "go install github.com/{repo}/mcp-servers/go/{name}@{ref}",
     "rust":   "cargo install --git https://github.com/{repo} --branch {ref} {name}",
 }
+REPO_SERVER_LANGS = frozenset(LANG_INSTALL_HINTS)
+REPO_SERVER_SKIP  = frozenset({"templates"})
 
 
 def parse_repo_servers(
     repo: str, ref: str, tree_entries: Iterable[Dict[str, Any]],
+    *, synced_at: Optional[str] = None,
 ) -> List[ContextForgeEntry]:
     """
     From a flat list of repo paths (from the GitHub Trees API), identify
@@ -217,19 +367,19 @@ def parse_repo_servers(
         if len(parts) < 3:
             continue
         _, lang, name = parts[0], parts[1], parts[2]
-        if lang not in {"python", "go", "rust"}:
+        if lang not in REPO_SERVER_LANGS:
             continue
-        if name in {"templates"}:
+        if name in REPO_SERVER_SKIP:
             continue
         seen[(lang, name)] = True
 
     out: List[ContextForgeEntry] = []
-    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    now_iso = synced_at or _now_iso()
     for (lang, name) in sorted(seen):
         homepage = f"https://github.com/{repo}/tree/{ref}/mcp-servers/{lang}/{name}"
         ident_url = f"github.com/{repo}#mcp-servers/{lang}/{name}"
         cat_id = f"mcp.ibm-cf.{lang}-{_slug(name)}.stdio.{_hash10(ident_url)}"
-        manifest_path = f"servers/{PROVIDER_DIR}/{cat_id}/manifest.json"
+        manifest_path = f"{OUR_PREFIX}{cat_id}/manifest.json"
 
         install_hint = LANG_INSTALL_HINTS.get(lang, "").format(
             repo=repo, ref=ref, name=name,
@@ -273,56 +423,121 @@ def parse_repo_servers(
 # --------------------------- index merge ---------------------------
 
 def load_index(repo_root: Path) -> Dict[str, Any]:
-    p = repo_root / "index.json"
-    if not p.exists():
+    try:
+        return _json_load_file(repo_root / "index.json")
+    except FileNotFoundError:
         return {"manifests": [], "items": [], "counts": {}}
-    return json.loads(p.read_text())
 
 
-def save_index(repo_root: Path, idx: Dict[str, Any]) -> None:
-    (repo_root / "index.json").write_text(json.dumps(idx, indent=2, sort_keys=True) + "\n")
+def _same_bytes_on_disk(p: Path, data: bytes) -> bool:
+    """True iff `p` already holds exactly `data` (size is checked first)."""
+    try:
+        if p.stat().st_size != len(data):
+            return False
+        return p.read_bytes() == data
+    except OSError:
+        return False
+
 
+def save_index(repo_root: Path, idx: Dict[str, Any], *, generated_at: str) -> bool:
+    """Stamp `idx` with `generated_at` and write it; return True iff written.
 
-def existing_source(repo_root: Path, manifest_path: str) -> Optional[str]:
-    """Return the `_source` field of an existing manifest, or None if absent."""
-    p = repo_root / manifest_path
-    if not p.exists():
-        return None
+    `idx` must still carry the `generated_at` it was loaded with. If it then
+    serialises to exactly the bytes on disk, the merge changed nothing and
+    index.json is left alone, so an unchanged upstream yields no diff.
+    Otherwise the new stamp is spliced into those same bytes rather than
+    serialising the whole index a second time.
+    """
+    p = repo_root / "index.json"
+    data = _json_dumps(idx)
+    if _same_bytes_on_disk(p, data):
+        return False
+    old = idx.get("generated_at")
+    idx["generated_at"] = generated_at
+    # Top-level keys are the only lines indented by exactly two spaces, and
+    # JSON strings never hold a raw newline, so this match is unambiguous.
+    key = b'\n  "generated_at": '
+    old_field = key + json.dumps(old).encode("ascii")
+    at = data.find(old_field) if isinstance(old, str) else -1
+    if at < 0:
+        data = _json_dumps(idx)
+    else:
+        new_field = key + json.dumps(generated_at).encode("ascii")
+        data = data[:at] + new_field + data[at + len(old_field):]
+    p.write_bytes(data)
+    return True
+
+
+def save_manifest_list(repo_root: Path, manifests: List[str]) -> bool:
+    """Mirror `index.json`'s `manifests` array into `manifests.ndjson`, one
+    path per line, for consumers that stream it without a JSON parser.
+    Return True iff written. Matches `jq -r '.manifests[]' index.json`."""
+    p = repo_root / "manifests.ndjson"
+    data = "".join(f"{m}\n" for m in manifests).encode("utf-8")
+    if _same_bytes_on_disk(p, data):
+        return False
+    p.write_bytes(data)
+    return True
+
+
+def read_manifest(repo_root: Path, manifest_path: str) -> Any:
+    """Return the parsed JSON of an existing manifest, or None if absent or
+    unreadable."""
+    # No exists() probe: a missing file surfaces as FileNotFoundError from the
+    # read itself, saving a stat per path.
     try:
-        m = json.loads(p.read_text())
-        return m.get("_source")
+        return _json_loads((repo_root / manifest_path).read_bytes())
     except Exception:
         return None
 
 
-_VOLATILE_FIELDS = {"_source_synced_at"}
+def _source_of(m: Any) -> Optional[str]:
+    return m.get("_source") if isinstance(m, dict) else None
+
+
+def existing_source(repo_root: Path, manifest_path: str) -> Optional[str]:
+    """Return the `_source` field of an existing manifest, or None if absent."""
+    return _source_of(read_manifest(repo_root, manifest_path))
+
+
+def read_manifests(repo_root: Path, manifest_paths: Iterable[str]) -> Dict[str, Any]:
+    """Map every manifest path to its `read_manifest` result."""
+    return {p: read_manifest(repo_root, p) for p in dict.fromkeys(manifest_paths)}
+
+
+_VOLATILE_FIELDS = frozenset({"_source_synced_at"})
+_UNREAD = object()
 
 
 def _stable_view(m: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in m.items() if k not in _VOLATILE_FIELDS}
 
 
-def write_manifest(repo_root: Path, entry: ContextForgeEntry) -> bool:
+def write_manifest(repo_root: Path, entry: ContextForgeEntry, *, old: Any = _UNREAD) -> bool:
     """Write the manifest if its meaningful content changed. Return True iff
-    a non-volatile field changed (i.e. not just `_source_synced_at`)."""
+    a non-volatile field changed (i.e. not just `_source_synced_at`).
+
+    `old` is the current on-disk content as returned by `read_manifest`, for
+    callers that already parsed it; by default the file is read here.
+    """
     p = repo_root / entry.manifest_path
-    p.parent.mkdir(parents=True, exist_ok=True)
-    new_text = json.dumps(entry.manifest, indent=2, sort_keys=True) + "\n"
-    if p.exists():
-        try:
-            old = json.loads(p.read_text())
-        except Exception:
-            old = None
-        if isinstance(old, dict) and _stable_view(old) == _stable_view(entry.manifest):
-            # Content unchanged; don't churn the file or report it as updated.
-            return False
-    p.write_text(new_text)
+    if old is _UNREAD:
+        old = read_manifest(repo_root, entry.manifest_path)
+    if isinstance(old, dict) and _stable_view(old) == _stable_view(entry.manifest):
+        # Content unchanged; don't churn the file or report it as updated.
+        return False
+    if old is None:
+        # A successful read proves the directory exists; only new (or
+        # unreadable) manifests need the mkdir.
+        p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(_json_dumps(entry.manifest))
     return True
 
 
 def merge_into_index(
     repo_root: Path, entries: List[ContextForgeEntry],
     *, prune_removed: bool, report: SyncReport,
+    generated_at: Optional[str] = None,
 ) -> Dict[str, Any]:
     idx = load_index(repo_root)
 
@@ -334,27 +549,46 @@ def merge_into_index(
     # not in this list is "inactive" / disabled and won't be touched.
     existing_manifests: List[str] = list(idx.get("manifests") or [])
 
-    our_existing_paths = {
+    # We only ever write under OUR_PREFIX (invariant 1), so only indexed
+    # manifests there can be ours; registry-sourced files are never opened.
+    # One batched pass parses those plus every path we are about to write;
+    # the parsed content serves both the collision check and write_manifest.
+    our_candidates = [
         path for path, it in existing_items.items()
-        if it and it.get("manifest_path") and existing_source(repo_root, path) == OUR_SOURCE
-    }
+        if isinstance(path, str) and path.startswith(OUR_PREFIX)
+    ]
+    on_disk = read_manifests(
+        repo_root,
+        itertools.chain(our_candidates, (e.manifest_path for e in entries)),
+    )
+    our_existing_paths = {path for path in our_candidates if _source_of(on_disk[path]) == OUR_SOURCE}
 
     new_paths: List[str] = []
     new_items: List[Dict[str, Any]] = []
+    seen_paths: Set[str] = set()
 
     for e in entries:
+        # The catalog id hashes the upstream URL, so a repeated manifest_path
+        # is a duplicated upstream entry: the first occurrence wins.
+        if e.manifest_path in seen_paths:
+            continue
+        seen_paths.add(e.manifest_path)
+
         # Collision check: never overwrite a path owned by a different source.
-        owner = existing_source(repo_root, e.manifest_path)
+        old = on_disk[e.manifest_path]
+        owner = _source_of(old)
         if owner is not None and owner != OUR_SOURCE:
             report.skipped_collisions.append(e.manifest_path)
             continue
 
         was_new = e.manifest_path not in our_existing_paths
-        wrote = write_manifest(repo_root, e)
+        wrote = write_manifest(repo_root, e, old=old)
         if was_new:
             report.added.append(e.cat_id)
         elif wrote:
             report.updated.append(e.cat_id)
+        else:
+            report.unchanged += 1
 
         new_paths.append(e.manifest_path)
         new_items.append({
@@ -373,11 +607,10 @@ def merge_into_index(
         stale = our_existing_paths - upstream_paths
         for p in sorted(stale):
             disk_path = repo_root / p
-            if disk_path.exists():
-                try:
-                    disk_path.unlink()
-                except OSError:
-                    pass
+            try:
+                disk_path.unlink()
+            except OSError:
+                pass
             # Also remove the manifest dir if empty.
             try:
                 disk_path.parent.rmdir()
@@ -408,9 +641,11 @@ def merge_into_index(
     counts["total_items"] = max(len(merged_items), counts["active_manifests"])
 
     # `sources` is informational; keep it accurate.
-    sources = counts.get("sources") if isinstance(counts.get("sources"), dict) else {}
+    sources = counts.get("sources")
+    if not isinstance(sources, dict):
+        sources = {}
     sources[OUR_SOURCE] = sum(
-        1 for it in merged_items if it.get("manifest_path", "").startswith(f"servers/{PROVIDER_DIR}/")
+        1 for it in merged_items if it.get("manifest_path", "").startswith(OUR_PREFIX)
     )
     sources["registry"] = len(merged_items) - sources[OUR_SOURCE]
     counts["sources"] = sources
@@ -418,9 +653,10 @@ def merge_into_index(
     idx["manifests"] = merged_manifests
     idx["items"]     = merged_items
     idx["counts"]    = counts
-    idx["generated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
 
-    save_index(repo_root, idx)
+    if not save_index(repo_root, idx, generated_at=generated_at or _now_iso()):
+        print("index.json unchanged")
+    save_manifest_list(repo_root, merged_manifests)
     return idx
 
 
@@ -440,14 +676,24 @@ def main() -> int:
 
     token = os.environ.get("GITHUB_TOKEN") or None
     repo_root = Path.cwd()
+    # One timestamp for the whole run: every manifest and the index agree.
+    run_ts = _now_iso()
     report = SyncReport()
     entries: List[ContextForgeEntry] = []
 
-    # 1) Parse mcp-catalog.yml
+    # The two upstream fetches are independent round trips: start both now
+    # and consume them in order below.
     cat_url = f"https://raw.githubusercontent.com/{args.repo}/{args.ref}/mcp-catalog.yml"
+    tree_url = f"https://api.github.com/repos/{args.repo}/git/trees/{args.ref}?recursive=1"
+    fetcher = ThreadPoolExecutor(max_workers=2)
+    cat_fetch = fetcher.submit(_http_get_text, cat_url, token=token)
+    tree_fetch = fetcher.submit(_http_get_json, tree_url, token=token)
+    fetcher.shutdown(wait=False)   # no further work; submitted fetches still run
+
+    # 1) Parse mcp-catalog.yml
     try:
-        cat_text = _http_get_text(cat_url, token=token)
-        cat_entries = parse_catalog_yml(cat_text, source_url=cat_url)
+        cat_text = cat_fetch.result()
+        cat_entries = parse_catalog_yml(cat_text, source_url=cat_url, synced_at=run_ts)
         entries.extend(cat_entries)
         report.fetched_catalog = len(cat_entries)
         print(f"parsed {len(cat_entries)} entries from {cat_url}")
@@ -457,11 +703,10 @@ def main() -> int:
 
     # 2) Walk mcp-servers/{python,go,rust} via the Trees API.
     try:
-        tree = _http_get_json(
-            f"https://api.github.com/repos/{args.repo}/git/trees/{args.ref}?recursive=1",
-            token=token,
+        tree = tree_fetch.result()
+        repo_entries = parse_repo_servers(
+            args.repo, args.ref, tree.get("tree") or [], synced_at=run_ts,
         )
-        repo_entries = parse_repo_servers(args.repo, args.ref, tree.get("tree") or [])
         entries.extend(repo_entries)
         report.fetched_repo_servers = len(repo_entries)
         print(f"parsed {len(repo_entries)} entries from mcp-servers/")
@@ -475,7 +720,11 @@ def main() -> int:
         return 1
 
     # 3) Merge.
-    merge_into_index(repo_root, entries, prune_removed=args.prune_removed, report=report)
+    merge_into_index(
+        repo_root, entries,
+        prune_removed=args.prune_removed, report=report,
+        generated_at=run_ts,
+    )
 
     summary = report.summary()
     print("summary:", json.dumps(summary, indent=2))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Sanity-check the top-level `index.json` before a sync workflow commits it.
+
+Shared by both writers of the index:
+
+  * .github/workflows/sync.yml    — after the MCP Registry harvest
+  * .github/workflows/addons.yml  — after the mcp-context-forge merge (--strict)
+
+Fatal checks (exit 1):
+
+  1. index.json exists and parses.
+  2. It carries a `manifests` or `items` list; with --strict, both lists.
+  3. `counts` holds numbers and `counts.active_manifests` is non-zero. An
+     empty result almost always means an upstream outage, and pushing it
+     would empty the live catalog.
+
+Warnings (never fatal):
+
+  * `counts.active_manifests` disagrees with len(manifests).
+  * mcp_server entries exist but promotion produced no tool entries, which
+    leaves the Tools tab on matrixhub.io empty.
+
+Usage:
+    python scripts/validate_index.py [--strict] [--index index.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load(p: Path) -> Any:
+    data = p.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN, which json.loads accepts
+    return json.loads(data)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--index", default="index.json",
+                    help="Path to the index to check (default: index.json)")
+    ap.add_argument("--strict", action="store_true",
+                    help="Require both `manifests` and `items` to be lists")
+    args = ap.parse_args()
+
+    p = Path(args.index)
+    try:
+        idx = _load(p)
+    except FileNotFoundError:
+        print(f"::error::{p} missing — refusing to continue.")
+        return 1
+    except ValueError as exc:
+        print(f"::error::{p} is not valid JSON: {exc}")
+        return 1
+    if not isinstance(idx, dict):
+        print(f"::error::{p} must be a JSON object")
+        return 1
+
+    manifests = idx.get("manifests")
+    items = idx.get("items")
+    if args.strict:
+        for key, val in (("manifests", manifests), ("items", items)):
+            if not isinstance(val, list):
+                print(f"::error::{p}: `{key}` array missing")
+                return 1
+    elif not isinstance(manifests, list) and not isinstance(items, list):
+        print(f"::error::{p} has neither 'manifests' nor 'items'")
+        return 1
+
+    counts = idx.get("counts") or {}
+    by_type = (counts.get("by_type") or {}) if isinstance(counts, dict) else {}
+    if not isinstance(counts, dict) or not isinstance(by_type, dict):
+        print(f"::error::{p}: `counts` and `counts.by_type` must be objects")
+        return 1
+    try:
+        active = int(counts.get("active_manifests", 0))
+        total  = int(counts.get("total_items", 0))
+        mcp_n  = int(by_type.get("mcp_server", 0))
+        tool_n = int(by_type.get("tool", 0))
+        agt_n  = int(by_type.get("agent", 0))
+    except (TypeError, ValueError) as exc:
+        print(f"::error::{p}: non-numeric value in `counts`: {exc}")
+        return 1
+
+    if active == 0:
+        print("::error::index has 0 active manifests — refusing to push.")
+        return 1
+    if isinstance(manifests, list) and active != len(manifests):
+        print(f"::warning::counts.active_manifests ({active}) != len(manifests) ({len(manifests)})")
+    if mcp_n > 0 and tool_n == 0:
+        print(
+            "::warning::Promotion produced 0 tool entries despite "
+            f"{mcp_n} mcp_servers. Tools tab on matrixhub.io will be "
+            "empty. Check that mcp_ingest is at a recent enough version."
+        )
+
+    print(
+        f"✅ Index valid — active={active}, total={total}, "
+        f"manifests_paths={len(manifests) if isinstance(manifests, list) else '-'}, "
+        f"items={len(items) if isinstance(items, list) else '-'}"
+    )
+    print(f"   per-type:  mcp_server={mcp_n}  tool={tool_n}  agent={agt_n}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())